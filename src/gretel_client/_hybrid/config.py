@@ -1,3 +1,5 @@
+import threading
+
 from typing import Any, Optional, Type, TypeVar
 
 from gretel_client._hybrid.connections_api import HybridConnectionsApi
@@ -47,6 +49,15 @@ def hybrid_session_config(
     if session is None:
         session = get_session_config()
 
+    if (
+        isinstance(session, _HybridSessionConfig)
+        and session._creds_encryption is creds_encryption
+        and session._deployment_user == deployment_user
+    ):
+        # Already configured with these settings, keep the session (and the API
+        # clients it has built) as-is.
+        return session
+
     return _HybridSessionConfig(session, creds_encryption, deployment_user)
 
 
@@ -105,8 +116,12 @@ class _HybridSessionConfig(ClientConfig):
     and purposes.
     """
 
-    # Annotations must be inherited from the parent, in order for ``as_dict`` to work.
-    __annotations__ = ClientConfig.__annotations__
+    __slots__ = (
+        "_creds_encryption",
+        "_deployment_user",
+        "_api_cache",
+        "_api_cache_lock",
+    )
 
     _creds_encryption: CredentialsEncryption
     _deployment_user: Optional[str]
@@ -117,20 +132,54 @@ class _HybridSessionConfig(ClientConfig):
         creds_encryption: CredentialsEncryption,
         deployment_user: Optional[str] = None,
     ):
-        settings = session.as_dict
-        super().__init__(**settings)
+        # ``session`` has already been resolved and validated, copy its state
+        # instead of running the settings through ``ClientConfig.__init__`` again.
+        self.__dict__.update(session.__dict__)
         self._creds_encryption = creds_encryption
         self._deployment_user = deployment_user
+        # API clients are expensive to build (connection pool, auth config), so
+        # the wrapped clients are built once per session and reused.
+        self._api_cache = {}
+        self._api_cache_lock = threading.Lock()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            # Public settings (endpoint, api key, ...) feed into the API
+            # clients, drop any clients built with the previous values.
+            self._clear_api_cache()
+
+    def _clear_api_cache(self) -> None:
+        with self._api_cache_lock:
+            self._api_cache.clear()
+
+    def _cached_api(self, key: tuple, factory):
+        with self._api_cache_lock:
+            api = self._api_cache.get(key)
+            if api is None:
+                api = self._api_cache[key] = factory()
+            return api
 
     def get_api(self, api_interface: Type[T], *args, **kwargs) -> T:
+        key = ("v0", api_interface, args, tuple(sorted(kwargs.items())))
+        return self._cached_api(
+            key, lambda: self._build_api(api_interface, *args, **kwargs)
+        )
+
+    def get_v1_api(self, api_interface: Type[T], *args, **kwargs) -> T:
+        key = ("v1", api_interface, args, tuple(sorted(kwargs.items())))
+        return self._cached_api(
+            key, lambda: self._build_v1_api(api_interface, *args, **kwargs)
+        )
+
+    def _build_api(self, api_interface: Type[T], *args, **kwargs) -> T:
         api = super().get_api(api_interface, *args, **kwargs)
         if api_interface == ProjectsApi:
             return HybridProjectsApi(api, self._deployment_user)
         return api
 
-    def get_v1_api(self, api_interface: Type[T]) -> T:
-
-        api = super().get_v1_api(api_interface)
+    def _build_v1_api(self, api_interface: Type[T], *args, **kwargs) -> T:
+        api = super().get_v1_api(api_interface, *args, **kwargs)
         if api_interface == WorkflowsApi:
             return HybridWorkflowsApi(api)
         if api_interface == ConnectionsApi:
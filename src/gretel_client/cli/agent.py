@@ -1,110 +1,195 @@
 import logging
+import os
 
+from collections import defaultdict
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 import click
 
-from gretel_client.agents.agent import AgentConfig, get_agent
-from gretel_client.agents.drivers.driver import GPU
 from gretel_client.cli.common import pass_session, SessionContext
 from gretel_client.config import get_session_config, RunnerMode
-from gretel_client.docker import AwsCredFile, CaCertFile, check_gpu, DataVolumeDef
+
+DISABLE_GPU_ENV_NAME = "GRETEL_DISABLE_GPU"
+
+_gpu_available: Optional[bool] = None
+
+
+class _PreviewFeatureGroup(click.Group):
+    """Command group that is only listed when preview features are enabled.
+
+    Visibility is resolved from the session config whenever click asks for
+    it, rather than once when this module is imported.
+    """
+
+    @property
+    def hidden(self) -> bool:
+        return not get_session_config().preview_features_enabled
+
+    @hidden.setter
+    def hidden(self, value: bool) -> None:
+        # ``click.Command.__init__`` always assigns ``hidden``, visibility
+        # is derived from the session config instead.
+        pass
 
 
 @click.group(
+    cls=_PreviewFeatureGroup,
     help="Connect Gretel with a data source.",
-    hidden=not get_session_config().preview_features_enabled,
 )
 def agent():
     ...
 
 
+def _check_gpu() -> bool:
+    """Checks for a GPU once per process, the check launches containers."""
+    global _gpu_available
+    if _gpu_available is None:
+        from gretel_client.docker import check_gpu
+
+        _gpu_available = check_gpu()
+    return _gpu_available
+
+
+class _VolumeType(click.ParamType):
+    name = "volume"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, tuple):
+            return value
+
+        host_path, _, target = value.partition(":")
+        if not host_path or not target:
+            self.fail(f"{value!r} is not a valid HOST:CONTAINER volume", param, ctx)
+        return host_path, Path(target)
+
+
+Volume = _VolumeType()
+
+
+def _parse_env(entry: str, param_hint: str) -> Tuple[str, str]:
+    key, sep, value = entry.partition("=")
+    if not sep or not key or any(c.isspace() for c in key):
+        raise click.BadParameter(
+            f"{entry!r} is not a valid KEY=VALUE entry", param_hint=param_hint
+        )
+    return key, value
+
+
 def build_logger(job_id: str) -> Callable:
     logger = logging.getLogger(f"job_{job_id}")
     return logger.info
 
 
+_START_OPTIONS = [
+    click.option(
+        "--driver",
+        metavar="NAME",
+        help=f"Specify driver used to launch new workers. For the docker driver, set {DISABLE_GPU_ENV_NAME}=1 to skip checking for a GPU.",
+        default="docker",
+    ),
+    click.option(
+        "--max-workers",
+        metavar="COUNT",
+        help="Max number of workers to launch.",
+        default=2,
+    ),
+    click.option(
+        "--project",
+        allow_from_autoenv=True,
+        envvar="GRETEL_DEFAULT_PROJECT",
+        help="CSV of Gretel projects to execute command from.",
+        metavar="NAME",
+    ),
+    click.option(
+        "--same-org-only",
+        is_flag=True,
+        envvar="GRETEL_SAME_ORG_ONLY",
+        allow_from_autoenv=True,
+        help="If this is set, only jobs from the same organization as the running user will be executed.",
+        type=bool,
+    ),
+    click.option(
+        "--auto-accept-project-invites",
+        is_flag=True,
+        envvar="GRETEL_AGENT_AUTO_ACCEPT_PROJECT_INVITES",
+        allow_from_autoenv=True,
+        help="If this is set, the Gretel Agent will automatically check for and accept project invites originating from within the organization.",
+        type=bool,
+    ),
+    click.option(
+        "--aws-cred-path",
+        metavar="PATH",
+        type=click.Path(exists=True, dir_okay=False),
+        help="Path to AWS credential file. These will be propagated to each worker.",
+    ),
+    click.option(
+        "--artifact-endpoint",
+        metavar="ENDPOINT",
+        help="Path to artifact endpoint. If none is provided Gretel Cloud will be used.",
+        default=None,
+        envvar="GRETEL_ARTIFACT_ENDPOINT",
+    ),
+    click.option(
+        "--runner-modes",
+        metavar="RUNNER_MODES",
+        help="Runner modes used to poll the jobs endpoint",
+        default=None,
+        envvar="RUNNER_MODES",
+        multiple=True,
+    ),
+    click.option(
+        "--env",
+        metavar="KEY=VALUE",
+        help="Pass environment variables into the worker container.",
+        multiple=True,
+    ),
+    click.option(
+        "--env-file",
+        metavar="PATH",
+        type=click.Path(exists=True, dir_okay=False),
+        help="Read KEY=VALUE environment variables for the worker container from a file. Blank lines and lines starting with # are ignored. Values passed with --env take precedence.",
+        multiple=True,
+    ),
+    click.option(
+        "--volume",
+        metavar="HOST:CONTAINER",
+        type=Volume,
+        help="Mount single file into the worker container. HOST and CONTAINER must be files.",
+        multiple=True,
+    ),
+    click.option(
+        "--ca-bundle",
+        metavar="PATH",
+        type=click.Path(exists=True, dir_okay=False),
+        help="Mount custom CA into each worker container.",
+    ),
+    click.option(
+        "--disable-cloud-logging",
+        help="Disable sending worker logs to Gretel Cloud.",
+        default=False,
+    ),
+    click.option(
+        "--enable-prometheus",
+        help="Enable the prometheus metrics endpoint on port 8080",
+        default=False,
+    ),
+]
+
+
+def _apply_options(options: List[Callable]) -> Callable:
+    """Applies a list of click option decorators, in the order listed."""
+
+    def decorator(fn: Callable) -> Callable:
+        for option in reversed(options):
+            fn = option(fn)
+        return fn
+
+    return decorator
+
+
 @agent.command(help="Start Gretel worker agent.")
-@click.option(
-    "--driver",
-    metavar="NAME",
-    help="Specify driver used to launch new workers.",
-    default="docker",
-)
-@click.option(
-    "--max-workers", metavar="COUNT", help="Max number of workers to launch.", default=2
-)
-@click.option(
-    "--project",
-    allow_from_autoenv=True,
-    envvar="GRETEL_DEFAULT_PROJECT",
-    help="CSV of Gretel projects to execute command from.",
-    metavar="NAME",
-)
-@click.option(
-    "--same-org-only",
-    is_flag=True,
-    envvar="GRETEL_SAME_ORG_ONLY",
-    allow_from_autoenv=True,
-    help="If this is set, only jobs from the same organization as the running user will be executed.",
-    type=bool,
-)
-@click.option(
-    "--auto-accept-project-invites",
-    is_flag=True,
-    envvar="GRETEL_AGENT_AUTO_ACCEPT_PROJECT_INVITES",
-    allow_from_autoenv=True,
-    help="If this is set, the Gretel Agent will automatically check for and accept project invites originating from within the organization.",
-    type=bool,
-)
-@click.option(
-    "--aws-cred-path",
-    metavar="PATH",
-    help="Path to AWS credential file. These will be propagated to each worker.",
-)
-@click.option(
-    "--artifact-endpoint",
-    metavar="ENDPOINT",
-    help="Path to artifact endpoint. If none is provided Gretel Cloud will be used.",
-    default=None,
-    envvar="GRETEL_ARTIFACT_ENDPOINT",
-)
-@click.option(
-    "--runner-modes",
-    metavar="RUNNER_MODES",
-    help="Runner modes used to poll the jobs endpoint",
-    default=None,
-    envvar="RUNNER_MODES",
-    multiple=True,
-)
-@click.option(
-    "--env",
-    metavar="KEY=VALUE",
-    help="Pass environment variables into the worker container.",
-    multiple=True,
-)
-@click.option(
-    "--volume",
-    metavar="HOST:CONTAINER",
-    help="Mount single file into the worker container. HOST and CONTAINER must be files.",
-    multiple=True,
-)
-@click.option(
-    "--ca-bundle",
-    metavar="PATH",
-    help="Mount custom CA into each worker container.",
-)
-@click.option(
-    "--disable-cloud-logging",
-    help="Disable sending worker logs to Gretel Cloud.",
-    default=False,
-)
-@click.option(
-    "--enable-prometheus",
-    help="Enable the prometheus metrics endpoint on port 8080",
-    default=False,
-)
+@_apply_options(_START_OPTIONS)
 @pass_session
 def start(
     sc: SessionContext,
@@ -115,13 +200,20 @@ def start(
     auto_accept_project_invites: bool = False,
     aws_cred_path: str = None,
     artifact_endpoint: str = None,
-    env: List[str] = None,
-    volume: List[str] = None,
+    env: Tuple[str, ...] = (),
+    env_file: Tuple[str, ...] = (),
+    volume: Tuple[Tuple[str, Path], ...] = (),
     ca_bundle: Optional[str] = None,
     disable_cloud_logging: bool = False,
     enable_prometheus: bool = False,
     runner_modes: List[str] = None,
 ):
+    # The agent and docker modules pull in a lot of transitive dependencies,
+    # only import them when the agent is actually started.
+    from gretel_client.agents.agent import AgentConfig, get_agent
+    from gretel_client.agents.drivers.driver import GPU
+    from gretel_client.docker import AwsCredFile, CaCertFile, DataVolumeDef
+
     sc.log.info(f"Starting Gretel agent using driver {driver}.")
     creds = []
 
@@ -131,25 +223,38 @@ def start(
     if ca_bundle:
         creds.append(CaCertFile(cred_from_agent=ca_bundle))
 
-    volumes = []
-    if volume:
-        for vol in volume:
-            host_path, target = vol.split(":", maxsplit=1)
-            target_path = Path(target)
-            volumes.append(
-                DataVolumeDef(str(target_path.parent), [(host_path, target_path.name)])
-            )
+    # Files that share a container directory are placed into a single data
+    # volume, rather than mounting one volume per file onto the same path.
+    volume_files = defaultdict(list)
+    for host_path, target_path in volume:
+        volume_files[str(target_path.parent)].append((host_path, target_path.name))
+    volumes = [
+        DataVolumeDef(target_dir, host_files)
+        for target_dir, host_files in volume_files.items()
+    ]
 
-    env_dict = dict(e.split("=", maxsplit=1) for e in env) if env else None
+    env_dict = {}
+    for path in env_file:
+        lines = Path(path).read_text().splitlines()
+        for line_no, line in enumerate((raw.strip() for raw in lines), start=1):
+            if line and not line.startswith("#"):
+                key, value = _parse_env(line, f"--env-file ({path}, line {line_no})")
+                env_dict[key] = value
+    for entry in env:
+        key, value = _parse_env(entry, "--env")
+        env_dict[key] = value
 
     capabilities = []
     if driver == "docker":
-        sc.log.info("Checking for GPU.")
-        if check_gpu():
-            capabilities.append(GPU)
-            sc.log.info("GPU found.")
+        if os.getenv(DISABLE_GPU_ENV_NAME) == "1":
+            sc.log.info(f"{DISABLE_GPU_ENV_NAME} is set. Continuing without a GPU.")
         else:
-            sc.log.info("No GPU found. Continuing without one.")
+            sc.log.info("Checking for GPU.")
+            if _check_gpu():
+                capabilities.append(GPU)
+                sc.log.info("GPU found.")
+            else:
+                sc.log.info("No GPU found. Continuing without one.")
     runner_modes_as_enum = None
     if runner_modes:
         runner_modes_as_enum = [
@@ -177,5 +282,5 @@ def start(
         runner_modes=runner_modes_as_enum,
     )
     agent = get_agent(config)
-    sc.register_cleanup(lambda: agent.interrupt())
+    sc.register_cleanup(agent.interrupt)
     agent.start()
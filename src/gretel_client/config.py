@@ -98,12 +98,12 @@ class RunnerMode(str, Enum):
 
     @classmethod
     def parse(cls, runner_mode: Union[str, RunnerMode]) -> RunnerMode:
-        if not isinstance(runner_mode, RunnerMode):
-            try:
-                runner_mode = RunnerMode(runner_mode)
-            except ValueError:
-                raise ValueError(f"Invalid runner_mode: {runner_mode}")
-        return runner_mode
+        if isinstance(runner_mode, RunnerMode):
+            return runner_mode
+        try:
+            return _RUNNER_MODES_BY_VALUE[runner_mode]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid runner_mode: {runner_mode}")
 
     @property
     def api_value(self) -> str:
@@ -114,6 +114,8 @@ class RunnerMode(str, Enum):
         return "manual"
 
 
+_RUNNER_MODES_BY_VALUE = {mode.value: mode for mode in RunnerMode}
+
 DEFAULT_RUNNER = RunnerMode.CLOUD
 
 
@@ -389,7 +391,7 @@ class ClientConfig:
     def as_dict(self) -> dict:
         return {
             prop: getattr(self, prop)
-            for prop in self.__annotations__
+            for prop in ClientConfig.__annotations__
             if not prop.startswith("_")
         }
 
@@ -468,9 +470,10 @@ def _load_config(config_path: Path = None) -> ClientConfig:
 
 
 def _check_config_perms(config_path: Path):
-    if not config_path.exists():
+    try:
+        mode = config_path.stat().st_mode
+    except FileNotFoundError:
         return
-    mode = config_path.stat().st_mode
     if mode & 0o077 == 0:
         return
     log.warn(f"Config file {config_path} is group- and/or world-readable!")
@@ -511,12 +514,19 @@ def write_config(config: ClientConfig, config_path: Union[str, Path] = None) ->
         ) from ex
 
 
-_session_client_config = _load_config()  # noqa
+_session_client_config: Optional[ClientConfig] = None
 
 
 def get_session_config() -> ClientConfig:
-    """Return the session's client config"""
+    """Return the session's client config.
+
+    The config is loaded from disk or the environment on first access and
+    reused for the rest of the session, until it is replaced via
+    ``set_session_config`` or ``configure_session``.
+    """
     global _session_client_config
+    if _session_client_config is None:
+        _session_client_config = _load_config()
     return _session_client_config
 
 
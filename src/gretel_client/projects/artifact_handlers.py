@@ -1,21 +1,51 @@
 from __future__ import annotations
 
+import functools
+import gzip
+import hashlib
+import io
 import logging
 import os
 import shutil
 import tempfile
+import threading
+import time
 import uuid
 
-from contextlib import contextmanager
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Protocol, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
 
 import requests
 import smart_open
+import urllib3
 
-from backports.cached_property import cached_property
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry_if_exception_type,
+    RetryCallState,
+    Retrying,
+    wait_exponential_jitter,
+)
+from urllib3.util import Retry
 
 import gretel_client.projects.common as common
 
@@ -23,9 +53,16 @@ from gretel_client.config import ClientConfig, DEFAULT_GRETEL_ARTIFACT_ENDPOINT
 from gretel_client.dataframe import _DataFrameT
 from gretel_client.projects.common import f, ModelArtifact, ModelRunArtifact, Pathlike
 from gretel_client.rest.api.projects_api import ProjectsApi
-from gretel_client.rest.exceptions import NotFoundException
+from gretel_client.rest.exceptions import ApiException, NotFoundException
 from gretel_client.rest.model.artifact import Artifact
 
+try:
+    from smart_open.compression import NO_COMPRESSION
+
+    _NO_COMPRESSION_KWARGS = {"compression": NO_COMPRESSION}
+except ImportError:  # pragma: no cover
+    # smart_open < 5.1 only has ``ignore_ext``, which newer versions warn about.
+    _NO_COMPRESSION_KWARGS = {"ignore_ext": True}
 try:
     from azure.identity import DefaultAzureCredential
 except ImportError:  # pragma: no cover
@@ -37,18 +74,164 @@ except ImportError:  # pragma: no cover
     BlobClient = None
 
 HYBRID_ARTIFACT_ENDPOINT_PREFIXES = ["azure://", "gs://", "s3://"]
+_REMOTE_PREFIXES = tuple(HYBRID_ARTIFACT_ENDPOINT_PREFIXES)
+
+_http_session: Optional[requests.Session] = None
+
+
+def _get_http_session() -> requests.Session:
+    """Returns the HTTP session shared by artifact transfers, so that repeated
+    uploads to the same signed URL host reuse pooled connections.
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        # Only connection errors are retried. Request bodies are streamed, so
+        # a request that failed after sending data can't be safely replayed.
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                connect=5, read=0, redirect=0, status=0, other=0, backoff_factor=0.5
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+def close_artifact_session() -> None:
+    """Closes the HTTP session used for artifact transfers, releasing any
+    pooled connections. A new session is created on the next transfer.
+    """
+    global _http_session
+    if _http_session is not None:
+        _http_session.close()
+        _http_session = None
+
+
+# Size of the reads, writes and buffers used when copying artifacts.
+_BLOCK_SIZE = 1 << 20
+
+
+class _BlockReader:
+    """Wraps a file object used as a request body, so that it's read and sent
+    in large blocks rather than ``http.client``'s default of 8 KiB.
+
+    The wrapper has a length, so the request is still sent with a
+    ``Content-Length`` header instead of chunked transfer encoding, which
+    signed object store URLs don't accept.
+    """
+
+    def __init__(self, fileobj: BinaryIO, length: int, block_size: int = _BLOCK_SIZE):
+        self._fileobj = fileobj
+        self._length = length
+        self._block_size = block_size
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is not None and 0 < size < self._block_size:
+            size = self._block_size
+        return self._fileobj.read(size)
+
+
+def _upload_body(src: BinaryIO) -> Union[BinaryIO, _BlockReader]:
+    """Returns a request body for ``src`` that is sent in large blocks, if the
+    remaining size of ``src`` can be determined.
+    """
+    try:
+        if isinstance(src, tempfile.SpooledTemporaryFile):
+            # ``fileno()`` would move an in-memory spooled file to disk.
+            pos = src.tell()
+            src.seek(0, os.SEEK_END)
+            length = src.tell() - pos
+            src.seek(pos)
+        else:
+            length = os.fstat(src.fileno()).st_size - src.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return src
+    return _BlockReader(src, length)
+
+
+def _is_local_path(path: str) -> bool:
+    # urlparse reads a Windows drive letter ("C:\\data\\x.csv") as a one
+    # letter scheme; no remote scheme we support is that short.
+    return len(urlparse(path).scheme) <= 1
+
+
+def _open_artifact(
+    path: str, mode: str, transport_params: Optional[Mapping[str, Any]] = None
+) -> BinaryIO:
+    """Opens an artifact source or target for a byte-for-byte copy.
+
+    Local paths are opened directly with a large buffer, ``smart_open`` is only
+    used for remote URIs.
+    """
+    if _is_local_path(path):
+        return open(os.path.expanduser(path), mode, buffering=_BLOCK_SIZE)
+    return smart_open.open(
+        path, mode, transport_params=transport_params, **_NO_COMPRESSION_KWARGS
+    )
+
+
+def _open_source(
+    src: Union[str, BinaryIO], transport_params: Optional[Mapping[str, Any]] = None
+) -> ContextManager[BinaryIO]:
+    """Opens an upload source, which is either a path or an already open,
+    readable file object.
+    """
+    if isinstance(src, str):
+        return _open_artifact(src, "rb", transport_params)
+    return nullcontext(src)
+
+
+_AZURE_CREDENTIALS_ENV_VARS = (
+    "AZURE_STORAGE_ACCOUNT_NAME",
+    "OAUTH_STORAGE_ACCOUNT_NAME",
+    "AZURE_BLOB_SAS_URL",
+    "AZURE_STORAGE_CONNECTION_STRING",
+)
+
+
+# Serializes building the cached SDK clients. lru_cache does not stop
+# concurrent first calls from each building a client, and neither boto3's
+# default session nor the Azure credential chain is safe to set up from
+# several threads at once. Reentrant, since building an Azure client may
+# build the default credential.
+_CLIENTS_LOCK = threading.RLock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_azure_credential() -> DefaultAzureCredential:
+    return DefaultAzureCredential()
 
 
 def _get_azure_blob_srv_client(endpoint: str) -> Optional[BlobServiceClient]:
-    for env_var_name in ("AZURE_STORAGE_ACCOUNT_NAME", "OAUTH_STORAGE_ACCOUNT_NAME"):
-        if (storage_account := os.getenv(env_var_name)) is not None:
+    # Building a client, in particular resolving the default credential chain,
+    # is expensive. Clients are reused for as long as the endpoint and the
+    # credentials configured through the environment stay the same.
+    env = tuple(os.getenv(name) for name in _AZURE_CREDENTIALS_ENV_VARS)
+    with _CLIENTS_LOCK:
+        return _create_azure_blob_srv_client(endpoint, env)
+
+
+@functools.lru_cache(maxsize=8)
+def _create_azure_blob_srv_client(
+    endpoint: str, env: Tuple[Optional[str], ...]
+) -> Optional[BlobServiceClient]:
+    storage_account_name, oauth_storage_account_name, sas_url, connect_str = env
+    for storage_account in (storage_account_name, oauth_storage_account_name):
+        if storage_account is not None:
             oauth_url = f"https://{storage_account}.blob.core.windows.net"
             return BlobServiceClient(
-                account_url=oauth_url, credential=DefaultAzureCredential()
+                account_url=oauth_url, credential=_get_default_azure_credential()
             )
 
     # Note: This will only work for one container
-    if (sas_url := os.getenv("AZURE_BLOB_SAS_URL")) is not None:
+    if sas_url is not None:
         client = BlobClient.from_blob_url(sas_url)
 
         artifact_endpoint = urlparse(endpoint)
@@ -59,31 +242,127 @@ def _get_azure_blob_srv_client(endpoint: str) -> Optional[BlobServiceClient]:
             )
         return client
 
-    if (connect_str := os.getenv("AZURE_STORAGE_CONNECTION_STRING")) is not None:
+    if connect_str is not None:
         return BlobServiceClient.from_connection_string(connect_str)
 
     raise ArtifactsException(
         "Could not find Azure storage account credentials. "
         "Please set one of the following environment variables: "
-        "AZURE_STORAGE_ACCOUNT_NAME, OAUTH_STORAGE_ACCOUNT_NAME, "
-        "AZURE_BLOB_SAS_URL, AZURE_STORAGE_CONNECTION_STRING."
+        f"{', '.join(_AZURE_CREDENTIALS_ENV_VARS)}."
     )
 
 
-def _get_transport_params(endpoint: str) -> dict:
+def reset_azure_clients() -> None:
+    """Drops cached Azure clients and credentials, so that they are created
+    again on next use.
+    """
+    with _CLIENTS_LOCK:
+        _create_azure_blob_srv_client.cache_clear()
+        _get_default_azure_credential.cache_clear()
+        _client_transport_params.cache_clear()
+
+
+_NO_TRANSPORT_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=16)
+def _client_transport_params(client: Any) -> Mapping[str, Any]:
+    return MappingProxyType({"client": client})
+
+
+def _get_transport_params(endpoint: str) -> Mapping[str, Any]:
     """Returns a set of transport params that are suitable for passing
     into calls to ``smart_open.open``.
+
+    The returned mapping is shared between calls and is read-only.
     """
-    client = None
     if endpoint and endpoint.startswith("azure"):
         client = _get_azure_blob_srv_client(endpoint)
-    return {"client": client} if client else {}
+        if client:
+            return _client_transport_params(client)
+    return _NO_TRANSPORT_PARAMS
+
+
+# Part size used by the native S3 transfers. boto3 uploads and downloads
+# the parts of large objects concurrently, whereas smart_open writes one
+# part at a time.
+_MULTIPART_CHUNK_SIZE = 8 << 20
+_MULTIPART_CONCURRENCY = 10
+
+
+def _get_s3_client() -> Any:
+    with _CLIENTS_LOCK:
+        return _create_s3_client()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_s3_client() -> Any:
+    import boto3
+
+    return boto3.client("s3")
+
+
+def _s3_transfer_config() -> Any:
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_chunksize=_MULTIPART_CHUNK_SIZE,
+        max_concurrency=_MULTIPART_CONCURRENCY,
+        use_threads=True,
+    )
+
+
+def _native_upload(src: Union[str, BinaryIO], dst_uri: str) -> bool:
+    """Uploads a local file or an open file object to S3 with ``boto3``.
+
+    Returns ``False`` if the destination is not an S3 URI, or ``boto3`` is
+    not installed. Callers should fall back to ``smart_open`` in that case.
+    """
+    if isinstance(src, str):
+        src = os.path.expanduser(src)
+    dst = urlparse(dst_uri)
+    if dst.scheme != "s3":
+        return False
+    try:
+        s3 = _get_s3_client()
+        upload = s3.upload_file if isinstance(src, str) else s3.upload_fileobj
+        upload(src, dst.netloc, dst.path.lstrip("/"), Config=_s3_transfer_config())
+    except ImportError:
+        return False
+    return True
+
+
+def _native_download(src_uri: str, dst_path: Path) -> bool:
+    """Downloads an S3 object to a local file with ``boto3``.
+
+    Returns ``False`` if the source is not an S3 URI, or ``boto3`` is not
+    installed.
+    """
+    src = urlparse(src_uri)
+    if src.scheme != "s3":
+        return False
+    try:
+        _get_s3_client().download_file(
+            src.netloc,
+            src.path.lstrip("/"),
+            str(dst_path),
+            Config=_s3_transfer_config(),
+        )
+    except ImportError:
+        return False
+    return True
 
 
 class ArtifactsException(Exception):
     pass
 
 
+class ArtifactsApiUnavailableException(ArtifactsException):
+    """Raised without calling the API when recent calls to the same API
+    method kept failing with server errors or rate limiting.
+    """
+
+
 # These exceptions are used for control flow with retries in get_artifact_manifest.
 # They are NOT intended to bubble up out of this module.
 class ManifestNotFoundException(Exception):
@@ -98,6 +377,213 @@ class ManifestPendingException(Exception):
         super().__init__(msg)
 
 
+# Time budgets for polling a manifest that is pending, and one that doesn't
+# exist (yet).
+_MANIFEST_PENDING_TIMEOUT = 30
+_MANIFEST_NOT_FOUND_TIMEOUT = 12
+
+
+def _stop_polling_manifest(retry_state: RetryCallState) -> bool:
+    if isinstance(retry_state.outcome.exception(), ManifestNotFoundException):
+        # Given that we waited for a short grace period to let the artifact
+        # become PENDING, if we are still getting 404's the key probably does
+        # not actually exist.
+        return retry_state.seconds_since_start >= _MANIFEST_NOT_FOUND_TIMEOUT
+    return retry_state.seconds_since_start >= _MANIFEST_PENDING_TIMEOUT
+
+
+def _manifest_after_polling(retry_state: RetryCallState) -> Optional[dict]:
+    # Instead of throwing an exception, return the pending manifest, or None
+    # if the manifest was never found.
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, ManifestPendingException):
+        return exc.manifest
+    return None
+
+
+class _TokenBucket:
+    """Thread-safe token bucket that allows ``rate`` calls per second on
+    average, and bursts of up to ``burst`` calls.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+            self._updated = now
+            # Take the token even if it isn't there yet, so that callers
+            # waiting concurrently queue up behind each other.
+            self._tokens -= 1
+            wait = -self._tokens / self._rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    state: _CircuitState = _CircuitState.CLOSED
+    failures: int = 0
+    open_until: float = 0.0
+
+
+class _ApiGate:
+    """Circuit breaker and rate limiter for the API calls made by artifact
+    handlers.
+
+    Calls are rate limited with a token bucket shared by all API methods.
+    After ``failure_threshold`` consecutive server errors, 429s, connection
+    errors or timeouts from the same API method, its circuit opens and calls
+    fail fast with ``ArtifactsApiUnavailableException`` for ``open_seconds``,
+    or for as long as the response's ``Retry-After`` header asks. Once that
+    time has passed, a single trial call is let through, which closes the
+    circuit again if it succeeds.
+
+    Other errors, such as a rejected API key or arguments that fail client
+    side validation, say nothing about whether the API is up and leave the
+    circuit as it is.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10,
+        burst: int = 20,
+        failure_threshold: int = 5,
+        open_seconds: float = 10,
+    ):
+        self._bucket = _TokenBucket(rate, burst)
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def call(self, name: str, method: Callable, *args, **kwargs) -> Any:
+        self._before_call(name)
+        self._bucket.acquire()
+        try:
+            result = method(*args, **kwargs)
+        except ApiException as ex:
+            if ex.status == 429 or (ex.status or 0) >= 500:
+                self._record_failure(name, _retry_after_seconds(ex))
+            elif ex.status:
+                # Client errors such as 404s mean that the API is up.
+                self._record_success(name)
+            else:
+                # Status 0: the request could not be built or TLS failed.
+                self._release_trial(name)
+            raise
+        except Exception as ex:
+            if _is_unavailable_error(ex):
+                self._record_failure(name, None)
+            else:
+                self._release_trial(name)
+            raise
+        self._record_success(name)
+        return result
+
+    def _before_call(self, name: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(name, _Circuit())
+            if circuit.state == _CircuitState.CLOSED:
+                return
+            if (
+                circuit.state == _CircuitState.OPEN
+                and time.monotonic() >= circuit.open_until
+            ):
+                circuit.state = _CircuitState.HALF_OPEN
+                return
+        raise ArtifactsApiUnavailableException(
+            f"Calls to {name} are failing, not retrying for now"
+        )
+
+    def _record_success(self, name: str) -> None:
+        with self._lock:
+            self._circuits[name] = _Circuit()
+
+    def _release_trial(self, name: str) -> None:
+        # A call that neither succeeded nor failed for lack of availability
+        # doesn't decide a half-open circuit; the next call is the trial.
+        with self._lock:
+            circuit = self._circuits.setdefault(name, _Circuit())
+            if circuit.state == _CircuitState.HALF_OPEN:
+                circuit.state = _CircuitState.OPEN
+
+    def _record_failure(self, name: str, retry_after: Optional[float]) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(name, _Circuit())
+            circuit.failures += 1
+            if (
+                circuit.state == _CircuitState.HALF_OPEN
+                or circuit.failures >= self._failure_threshold
+                or retry_after is not None
+            ):
+                circuit.state = _CircuitState.OPEN
+                circuit.open_until = time.monotonic() + (
+                    retry_after if retry_after is not None else self._open_seconds
+                )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+
+_UNAVAILABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    urllib3.exceptions.NewConnectionError,
+    urllib3.exceptions.ProtocolError,
+    urllib3.exceptions.TimeoutError,
+)
+
+
+def _is_unavailable_error(ex: Exception) -> bool:
+    """Whether ``ex`` means that the API could not be reached.
+
+    urllib3 wraps connection errors that outlast its retries in a
+    ``MaxRetryError``. ``GretelApiRetry`` also raises a bare one for a 403
+    that is not throttling, which has no ``reason``.
+    """
+    if isinstance(ex, urllib3.exceptions.MaxRetryError):
+        return isinstance(ex.reason, _UNAVAILABLE_ERRORS)
+    return isinstance(ex, _UNAVAILABLE_ERRORS)
+
+
+def _retry_after_seconds(ex: ApiException) -> Optional[float]:
+    try:
+        return max(0.0, float(ex.headers["Retry-After"]))
+    except (KeyError, TypeError, ValueError):
+        # Missing, or given as an HTTP date, which we don't bother parsing.
+        return None
+
+
+# Shared by all handlers, so that concurrent callers back off together.
+_api_gate = _ApiGate()
+
+
+def _gated_api_call(
+    projects_api: ProjectsApi, name: str, project_name: str
+) -> Callable[..., Any]:
+    """Returns the ``projects_api`` method ``name``, bound to a project and
+    called through ``_api_gate``.
+    """
+    return functools.partial(
+        _api_gate.call, name, getattr(projects_api, name), project_id=project_name
+    )
+
+
 class _Project(Protocol):
     @property
     def project_id(self) -> str:
@@ -190,6 +676,31 @@ class CloudArtifactsHandler:
         self.projects_api = projects_api
         self.project_id = project_id
         self.project_name = project_name
+        # Artifact keys of previous uploads, by ``_upload_cache_key``.
+        self._uploaded_artifacts: Dict[Tuple, str] = {}
+
+        # API calls for this project, bound once rather than on every call.
+        self._create_artifact = _gated_api_call(
+            projects_api, "create_artifact", project_name
+        )
+        self._get_artifacts = _gated_api_call(
+            projects_api, "get_artifacts", project_name
+        )
+        self._download_artifact = _gated_api_call(
+            projects_api, "download_artifact", project_name
+        )
+        self._get_artifact_manifest = _gated_api_call(
+            projects_api, "get_artifact_manifest", project_name
+        )
+        self._delete_artifact = functools.partial(
+            projects_api.delete_artifact, project_id=project_name
+        )
+        self._get_model_artifact = functools.partial(
+            projects_api.get_model_artifact, project_id=project_name
+        )
+        self._get_record_handler_artifact = functools.partial(
+            projects_api.get_record_handler_artifact, project_id=project_name
+        )
 
     def validate_data_source(
         self,
@@ -204,17 +715,22 @@ class CloudArtifactsHandler:
         if self._does_not_require_upload(artifact_path):
             return artifact_path
 
+        cache_key = _upload_cache_key(artifact_path)
+        if cache_key in self._uploaded_artifacts:
+            return self._uploaded_artifacts[cache_key]
+
         with _get_artifact_path_and_file_name(artifact_path) as art_path_and_file:
-            artifact_path, file_name = art_path_and_file
-            with smart_open.open(artifact_path, "rb", ignore_ext=True) as src:
-                art_resp = self.projects_api.create_artifact(
-                    project_id=self.project_name, artifact=Artifact(filename=file_name)
-                )
+            artifact_src, file_name = art_path_and_file
+            with _open_source(artifact_src) as src:
+                art_resp = self._create_artifact(artifact=Artifact(filename=file_name))
                 artifact_key = art_resp[f.DATA][f.KEY]
                 url = art_resp[f.DATA][f.URL]
-                upload_resp = requests.put(url, data=src)
+                upload_resp = _get_http_session().put(url, data=_upload_body(src))
                 upload_resp.raise_for_status()
-                return artifact_key
+
+        if cache_key is not None:
+            self._uploaded_artifacts[cache_key] = artifact_key
+        return artifact_key
 
     def _does_not_require_upload(
         self, artifact_path: Union[Path, str, _DataFrameT]
@@ -222,19 +738,18 @@ class CloudArtifactsHandler:
         return isinstance(artifact_path, str) and artifact_path.startswith("gretel_")
 
     def delete_project_artifact(self, key: str) -> None:
-        return self.projects_api.delete_artifact(project_id=self.project_name, key=key)
+        self._uploaded_artifacts = {
+            cache_key: artifact_key
+            for cache_key, artifact_key in self._uploaded_artifacts.items()
+            if artifact_key != key
+        }
+        return self._delete_artifact(key=key)
 
     def list_project_artifacts(self) -> List[dict]:
-        return (
-            self.projects_api.get_artifacts(project_id=self.project_name)
-            .get(f.DATA)
-            .get(f.ARTIFACTS)
-        )
+        return self._get_artifacts().get(f.DATA).get(f.ARTIFACTS)
 
     def get_project_artifact_link(self, key: str) -> str:
-        resp = self.projects_api.download_artifact(
-            project_id=self.project_name, key=key
-        )
+        resp = self._download_artifact(key=key)
         return resp[f.DATA][f.DATA][f.URL]
 
     @contextmanager
@@ -247,35 +762,39 @@ class CloudArtifactsHandler:
     # The server side API will return manifests with PENDING status if artifact processing has not completed
     # or it will return a 404 (not found) if you immediately request the artifact before processing has even started.
     # This is correct but not convenient.  To keep every end user from writing their own retry logic, we add some here.
-    @retry(
-        wait=wait_fixed(2),
-        stop=stop_after_attempt(15),
-        retry=retry_if_exception_type(ManifestPendingException),
-        # Instead of throwing an exception, return the pending manifest.
-        retry_error_callback=lambda retry_state: retry_state.outcome.exception().manifest,
-    )
-    @retry(
-        wait=wait_fixed(3),
-        stop=stop_after_attempt(5),
-        retry=retry_if_exception_type(ManifestNotFoundException),
-        # Instead of throwing an exception, return None.
-        # Given that we waited for a short grace period to let the artifact become PENDING,
-        # if we are still getting 404's the key probably does not actually exist.
-        retry_error_callback=lambda retry_state: None,
-    )
+    # Waits back off exponentially with jitter, so that a manifest that is
+    # ready quickly is returned quickly, and parallel callers don't poll the
+    # API in lockstep.
     def get_project_artifact_manifest(
         self,
         key: str,
         retry_on_not_found: bool = True,
         retry_on_pending: bool = True,
     ) -> Dict[str, Any]:
-        resp = None
+        if not (retry_on_not_found or retry_on_pending):
+            return self._fetch_manifest_once(key, False, False)
+        retrying = Retrying(
+            wait=wait_exponential_jitter(initial=0.5, max=8, jitter=0.5),
+            stop=_stop_polling_manifest,
+            retry=retry_if_exception_type(
+                (ManifestPendingException, ManifestNotFoundException)
+            ),
+            retry_error_callback=_manifest_after_polling,
+        )
+        return retrying(
+            self._fetch_manifest_once, key, retry_on_not_found, retry_on_pending
+        )
+
+    def _fetch_manifest_once(
+        self, key: str, retry_on_not_found: bool, retry_on_pending: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Fetches a manifest, raising the control-flow exceptions above for
+        the conditions that should be retried.
+        """
         try:
-            resp = self.projects_api.get_artifact_manifest(
-                project_id=self.project_name, key=key
-            )
+            resp = self._get_artifact_manifest(key=key)
         except NotFoundException:
-            raise ManifestNotFoundException()
+            resp = None
         if retry_on_not_found and resp is None:
             raise ManifestNotFoundException()
         if retry_on_pending and resp is not None and resp.get("status") == "pending":
@@ -283,9 +802,7 @@ class CloudArtifactsHandler:
         return resp
 
     def get_model_artifact_link(self, model_id: str, artifact_type: str) -> str:
-        art_resp = self.projects_api.get_model_artifact(
-            project_id=self.project_name, model_id=model_id, type=artifact_type
-        )
+        art_resp = self._get_model_artifact(model_id=model_id, type=artifact_type)
         return art_resp[f.DATA][f.URL]
 
     def get_record_handler_artifact_link(
@@ -294,8 +811,7 @@ class CloudArtifactsHandler:
         record_handler_id: str,
         artifact_type: str,
     ) -> str:
-        resp = self.projects_api.get_record_handler_artifact(
-            project_id=self.project_name,
+        resp = self._get_record_handler_artifact(
             model_id=model_id,
             record_handler_id=record_handler_id,
             type=artifact_type,
@@ -316,18 +832,15 @@ class HybridArtifactsHandler:
     def __init__(self, endpoint: str, project_id: str):
         self.endpoint = endpoint
         self.project_id = project_id
-
-    @cached_property
-    def data_sources_dir(self) -> str:
-        return f"{self.endpoint}/sources/{self.project_id}"
+        self._link_prefix = f"{endpoint}/{project_id}"
+        self.data_sources_dir = f"{endpoint}/sources/{project_id}"
 
     def validate_data_source(
         self,
         artifact_path: Pathlike,
     ) -> bool:
-        for supported_remote in HYBRID_ARTIFACT_ENDPOINT_PREFIXES:
-            if str(artifact_path).startswith(supported_remote):
-                return True
+        if str(artifact_path).startswith(_REMOTE_PREFIXES):
+            return True
 
         return common.validate_data_source(artifact_path)
 
@@ -342,29 +855,33 @@ class HybridArtifactsHandler:
             return artifact_path
 
         with _get_artifact_path_and_file_name(artifact_path) as art_path_and_file:
-            artifact_path, file_name = art_path_and_file
+            artifact_src, file_name = art_path_and_file
             data_source_file_name = f"gretel_{uuid.uuid4().hex}_{file_name}"
             target_out = f"{self.data_sources_dir}/{data_source_file_name}"
 
-            with smart_open.open(
-                artifact_path,
-                "rb",
-                ignore_ext=True,
-                transport_params=_get_transport_params(self.endpoint),
-            ) as in_stream, smart_open.open(
-                target_out, "wb", transport_params=_get_transport_params(self.endpoint)
+            if _native_upload(artifact_src, target_out):
+                return target_out
+
+            transport_params = _get_transport_params(self.endpoint)
+            with _open_source(
+                artifact_src, transport_params
+            ) as in_stream, _open_artifact(
+                target_out, "wb", transport_params
             ) as out_stream:
-                shutil.copyfileobj(in_stream, out_stream)
+                shutil.copyfileobj(in_stream, out_stream, _BLOCK_SIZE)
 
             return target_out
 
     def _does_not_require_upload(
         self, artifact_path: Union[Path, str, _DataFrameT]
     ) -> bool:
-        return (
-            isinstance(artifact_path, (str, Path))
-            and not Path(artifact_path).expanduser().exists()
-        )
+        if not isinstance(artifact_path, (str, Path)):
+            return False
+        # Remote URIs are never uploaded, there's no need to look them up on
+        # the local filesystem.
+        if isinstance(artifact_path, str) and "://" in artifact_path:
+            return True
+        return not Path(artifact_path).expanduser().exists()
 
     def delete_project_artifact(self, key: str) -> None:
         raise ArtifactsException("Cannot delete hybrid artifacts")
@@ -398,11 +915,8 @@ class HybridArtifactsHandler:
         raise ArtifactsException("Artifact manifests do not exist for hybrid artifacts")
 
     def get_model_artifact_link(self, model_id: str, artifact_type: str) -> str:
-        filename = ARTIFACT_FILENAMES.get(artifact_type)
-        if filename is None:
-            raise ArtifactsException(f"Unrecognized artifact type: `{artifact_type}`")
-
-        return f"{self.endpoint}/{self.project_id}/model/{model_id}/{filename}"
+        filename = _artifact_filename(artifact_type)
+        return f"{self._link_prefix}/model/{model_id}/{filename}"
 
     def get_record_handler_artifact_link(
         self,
@@ -410,11 +924,8 @@ class HybridArtifactsHandler:
         record_handler_id: str,
         artifact_type: str,
     ) -> str:
-        filename = ARTIFACT_FILENAMES.get(artifact_type)
-        if filename is None:
-            raise ArtifactsException(f"Unrecognized artifact type: `{artifact_type}`")
-
-        return f"{self.endpoint}/{self.project_id}/run/{record_handler_id}/{filename}"
+        filename = _artifact_filename(artifact_type)
+        return f"{self._link_prefix}/run/{record_handler_id}/{filename}"
 
     def download(
         self,
@@ -480,41 +991,136 @@ class NoneArtifactsHandler:
         raise NotImplementedError("no artifact endpoint is configured")
 
 
+def _basename_from_url(url: str) -> str:
+    """Returns the file name at the end of a URL or path, without any
+    query string.
+    """
+    if "#" in url or ";" in url:
+        # Fragments and path params are rare enough to leave to urllib.
+        return Path(urlparse(url).path).name
+    return url.split("?", 1)[0].rsplit("/", 1)[-1]
+
+
 def _download(
     download_link: str,
     output_path: Path,
     artifact_type: str,
     log: logging.Logger,
-    transport_params: Optional[dict] = None,
+    transport_params: Optional[Mapping[str, Any]] = None,
 ) -> None:
-    target_out = output_path / Path(urlparse(download_link).path).name
+    target_out = output_path / _basename_from_url(download_link)
     try:
-        with smart_open.open(
-            download_link, "rb", ignore_ext=True, transport_params=transport_params
-        ) as src, smart_open.open(
-            target_out, "wb", ignore_ext=True, transport_params=transport_params
+        if _native_download(download_link, target_out):
+            return
+        with _open_artifact(download_link, "rb", transport_params) as src, open(
+            target_out, "wb", buffering=_BLOCK_SIZE
         ) as dest:
-            shutil.copyfileobj(src, dest)
-    except:
+            shutil.copyfileobj(src, dest, _BLOCK_SIZE)
+    except Exception as ex:
         log.error(
             f"Could not download {artifact_type}. The file may not exist, or you may not have access to it. You might "
             f"retry this request."
         )
+        raise ArtifactsException(f"Could not download {artifact_type}") from ex
+
+
+def download_many(
+    handler: ArtifactsHandler,
+    downloads: Iterable[Tuple[str, Path, str]],
+    log: logging.Logger,
+    max_workers: int = 8,
+) -> List[str]:
+    """Downloads several artifacts concurrently.
+
+    Args:
+        handler: The artifacts handler to download with.
+        downloads: ``(download_link, output_path, artifact_type)`` tuples.
+        log: Logger that download failures are reported to.
+        max_workers: The maximum number of concurrent downloads.
+
+    Returns:
+        The artifact types that could not be downloaded.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                handler.download, download_link, output_path, artifact_type, log
+            ): artifact_type
+            for download_link, output_path, artifact_type in downloads
+        }
+        failed = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except ArtifactsException:
+                # The failure is already logged by the handler.
+                failed.append(futures[future])
+    return failed
+
+
+def _upload_cache_key(artifact_path: Union[Path, str, _DataFrameT]) -> Optional[Tuple]:
+    """Returns a key that identifies the contents of an upload source, or
+    ``None`` if there isn't a cheap way to compute one.
+
+    Local files are identified by their path, size and modification time,
+    DataFrames by a hash of their columns, dtypes and values, so neither has
+    to be read or serialized in full.
+    """
+    if isinstance(artifact_path, _DataFrameT):
+        try:
+            from pandas.util import hash_pandas_object
+
+            row_hashes = hash_pandas_object(artifact_path, index=False)
+        except (ImportError, TypeError):
+            # Unhashable values, such as lists.
+            return None
+        digest = hashlib.sha256(repr(list(artifact_path.columns)).encode())
+        # The row hashes ignore dtypes, e.g. ``True`` and ``1`` hash the same,
+        # but the two are written out differently.
+        digest.update(repr(list(artifact_path.dtypes)).encode())
+        digest.update(row_hashes.values.tobytes())
+        return ("dataframe", digest.hexdigest())
+    try:
+        path = os.path.realpath(os.path.expanduser(artifact_path))
+        stat = os.stat(path)
+    except (TypeError, OSError):
+        return None
+    return ("file", path, stat.st_size, stat.st_mtime_ns)
+
+
+def _write_dataframe_csv_gz(df: _DataFrameT, dest: BinaryIO) -> None:
+    # ``mtime=0`` keeps the output identical for identical frames. Level 6,
+    # zlib's own default, compresses CSV almost as well as gzip's default of
+    # 9 at a fraction of the CPU time, which matters for frames near the
+    # spool limit.
+    with gzip.GzipFile(fileobj=dest, mode="wb", compresslevel=6, mtime=0) as gz:
+        text = io.TextIOWrapper(gz, encoding="utf-8", newline="")
+        df.to_csv(text, index=False)
+        text.flush()
+        # Detach, so that the wrapper can't close ``gz`` out from under us.
+        text.detach()
+    dest.seek(0)
+
+
+_DATAFRAME_SPOOL_MAX_SIZE = 256 << 20
 
 
 @contextmanager
 def _get_artifact_path_and_file_name(
     artifact_path: Union[Path, str, _DataFrameT]
-) -> Tuple[str, str]:
+) -> Tuple[Union[str, BinaryIO], str]:
+    """Yields the source to upload an artifact from, and the file name to
+    upload it as.
+
+    The source is a path for files, and a gzipped CSV file for DataFrames.
+    That file is kept in memory unless it grows beyond
+    ``_DATAFRAME_SPOOL_MAX_SIZE``, so small and medium DataFrames are
+    uploaded without a round trip to disk.
+    """
     if isinstance(artifact_path, _DataFrameT):
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            artifact_path.to_csv(tmp_file.name, index=False)
-            file_name = f"dataframe-{uuid.uuid4()}.csv"
-            try:
-                yield tmp_file.name, file_name
-            finally:
-                tmp_file.close()
-                os.unlink(tmp_file.name)
+        with tempfile.SpooledTemporaryFile(max_size=_DATAFRAME_SPOOL_MAX_SIZE) as buf:
+            _write_dataframe_csv_gz(artifact_path, buf)
+            yield buf, f"dataframe-{uuid.uuid4()}.csv.gz"
     else:
         if isinstance(artifact_path, Path):
             artifact_path = str(artifact_path)
@@ -541,3 +1147,12 @@ ARTIFACT_FILENAMES = {
     ModelRunArtifact.RUN_LOGS: "logs.json.gz",
     ModelRunArtifact.OUTPUT_FILES: "output_files.tar.gz",
 }
+
+
+def _artifact_filename(artifact_type: str) -> str:
+    try:
+        return ARTIFACT_FILENAMES[artifact_type]
+    except KeyError:
+        raise ArtifactsException(
+            f"Unrecognized artifact type: `{artifact_type}`"
+        ) from None
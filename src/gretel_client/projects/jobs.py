@@ -33,6 +33,7 @@ from gretel_client.projects.artifact_handlers import (
     _get_transport_params,
     ArtifactsHandler,
     CloudArtifactsHandler,
+    download_many,
     HybridArtifactsHandler,
 )
 from gretel_client.projects.common import f, ModelArtifact, WAIT_UNTIL_DONE
@@ -391,13 +392,16 @@ class Job(ABC):
         output_path = Path(target_dir)
         output_path.mkdir(exist_ok=True, parents=True)
         log.info(f"Downloading model artifacts to {output_path.resolve()}")
-        for artifact_type, download_link in self.get_artifacts():
-            # we don't need to download cloud model artifacts
-            if artifact_type == ModelArtifact.MODEL.value:
-                continue
-            self.project.default_artifacts_handler.download(
-                download_link, output_path, artifact_type, log
-            )
+        download_many(
+            self.project.default_artifacts_handler,
+            (
+                (download_link, output_path, artifact_type)
+                for artifact_type, download_link in self.get_artifacts()
+                # we don't need to download cloud model artifacts
+                if artifact_type != ModelArtifact.MODEL.value
+            ),
+            log,
+        )
 
     def _get_report_contents(
         self, report_path: Optional[str] = None, artifact_type: Optional[str] = None
@@ -8,6 +8,7 @@ from gretel_client.config import (
     DEFAULT_GRETEL_ARTIFACT_ENDPOINT,
     DEFAULT_RUNNER,
 )
+from gretel_client.projects.artifact_handlers import _api_gate, reset_azure_clients
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -30,6 +31,20 @@ def configure_session_client():
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_cached_azure_clients():
+    reset_azure_clients()
+    yield
+    reset_azure_clients()
+
+
+@pytest.fixture(autouse=True)
+def reset_artifacts_api_gate():
+    _api_gate.reset()
+    yield
+    _api_gate.reset()
+
+
 @pytest.fixture
 def dev_ep() -> str:
     return "https://api-dev.gretel.cloud"
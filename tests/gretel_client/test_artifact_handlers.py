@@ -1,23 +1,43 @@
+import gzip
 import os
 import tempfile
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pandas as pd
 import pytest
 
 from azure.storage.blob import BlobClient, BlobServiceClient
+from urllib3.exceptions import MaxRetryError, NewConnectionError
 
 from gretel_client.config import DEFAULT_GRETEL_ARTIFACT_ENDPOINT
 from gretel_client.projects.artifact_handlers import (
+    _ApiGate,
+    _basename_from_url,
+    _create_s3_client,
     _get_artifact_path_and_file_name,
+    _get_http_session,
+    _get_s3_client,
     _get_transport_params,
+    _is_local_path,
+    ArtifactsApiUnavailableException,
     ArtifactsException,
+    close_artifact_session,
+    CloudArtifactsHandler,
+    download_many,
     hybrid_handler,
     HybridArtifactsHandler,
+    reset_azure_clients,
 )
 from gretel_client.projects.exceptions import DataSourceError
+from gretel_client.rest.exceptions import (
+    ApiException,
+    ApiValueError,
+    NotFoundException,
+)
 
 
 @pytest.fixture()
@@ -133,14 +153,73 @@ def test_missing_environment_variable_error_with_azure_hybrid():
         _get_transport_params("azure://my-bucket")
 
 
+def test_azure_clients_are_reused():
+    conn_str = "BlobEndpoint=https://test.blob.core.windows.net/"
+    with patch.dict(os.environ, {"AZURE_STORAGE_CONNECTION_STRING": conn_str}):
+        client = _get_transport_params("azure://my-bucket")["client"]
+        assert _get_transport_params("azure://my-bucket")["client"] is client
+
+        reset_azure_clients()
+        assert _get_transport_params("azure://my-bucket")["client"] is not client
+
+    with patch.dict(
+        os.environ,
+        {
+            "AZURE_STORAGE_CONNECTION_STRING": "BlobEndpoint=https://other.blob.core.windows.net/"
+        },
+    ):
+        other_client = _get_transport_params("azure://my-bucket")["client"]
+        assert other_client.account_name == "other"
+
+
+def test_transport_params_are_shared_and_read_only():
+    conn_str = "BlobEndpoint=https://test.blob.core.windows.net/"
+    with patch.dict(os.environ, {"AZURE_STORAGE_CONNECTION_STRING": conn_str}):
+        transport_params = _get_transport_params("azure://my-bucket")
+        assert _get_transport_params("azure://my-bucket") is transport_params
+        with pytest.raises(TypeError):
+            transport_params["client"] = None
+
+    assert _get_transport_params("s3://my-bucket") == {}
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("https://signed.url/a/report.html.gz?X-Amz-Signature=abc", "report.html.gz"),
+        ("s3://bucket/project_id/model/model_id/logs.json.gz", "logs.json.gz"),
+        ("/tmp/endpoint/project_id/run/id/data.gz", "data.gz"),
+        ("https://signed.url/a/data.gz?sig=a/b#frag", "data.gz"),
+    ],
+)
+def test_basename_from_url(url, expected):
+    assert _basename_from_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("/tmp/data.csv", True),
+        ("data.csv", True),
+        ("C:\\data\\data.csv", True),
+        ("c:/data/data.csv", True),
+        ("s3://bucket/data.csv", False),
+        ("gs://bucket/data.csv", False),
+        ("https://signed.url/data.csv", False),
+    ],
+)
+def test_is_local_path(path, expected):
+    assert _is_local_path(path) is expected
+
+
 def test_get_artifact_path_and_file_name():
     # Test a DataFrame first
     dataframe = pd.DataFrame(data={"foo": [1, 2, 3], "bar": [4, 5, 6]})
     with _get_artifact_path_and_file_name(dataframe) as data:
-        artifact_path, file_name = data
-        assert Path(artifact_path).is_file()
+        artifact_src, file_name = data
+        assert gzip.decompress(artifact_src.read()) == b"foo,bar\n1,4\n2,5\n3,6\n"
         assert file_name.startswith("dataframe")
-        assert file_name.endswith(".csv")
+        assert file_name.endswith(".csv.gz")
 
     # Test a local file
     with tempfile.NamedTemporaryFile() as tmp_file:
@@ -150,6 +229,310 @@ def test_get_artifact_path_and_file_name():
             assert file_name == Path(tmp_file.name).name  # just file name
 
 
+@patch("gretel_client.projects.artifact_handlers._get_http_session")
+def test_cloud_upload_local_file_as_project_artifact(
+    get_http_session: MagicMock, tmp_path: Path
+):
+    projects_api = MagicMock()
+    projects_api.create_artifact.return_value = {
+        "data": {"key": "gretel_abc_data.csv", "url": "https://signed.url/data.csv"}
+    }
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+
+    source = tmp_path / "data.csv"
+    source.write_bytes(b"h1,h2\n1,2\n")
+    artifact_key = handler.upload_project_artifact(str(source))
+
+    assert artifact_key == "gretel_abc_data.csv"
+    session = get_http_session.return_value
+    session.put.assert_called_once_with("https://signed.url/data.csv", data=ANY)
+    session.put.return_value.raise_for_status.assert_called_once()
+    # The body keeps a known length, so no chunked transfer encoding is used.
+    assert len(session.put.call_args.kwargs["data"]) == 10
+
+
+@patch("uuid.uuid4")
+@patch("gretel_client.projects.artifact_handlers._get_http_session")
+def test_cloud_upload_dataframe_as_project_artifact(
+    get_http_session: MagicMock, uuid4: MagicMock
+):
+    uuid4.return_value = "df-uuid"
+    projects_api = MagicMock()
+    projects_api.create_artifact.return_value = {
+        "data": {"key": "gretel_abc_data.csv", "url": "https://signed.url/data.csv"}
+    }
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+    session = get_http_session.return_value
+    uploaded = []
+
+    def put(url, data):
+        body = data.read()
+        # The body has a known length, without spooling the DataFrame to disk.
+        assert len(data) == len(body)
+        assert not data._fileobj._rolled
+        uploaded.append(body)
+        return MagicMock()
+
+    session.put.side_effect = put
+
+    dataframe = pd.DataFrame(data={"foo": [1, 2, 3], "bar": [4, 5, 6]})
+    artifact_key = handler.upload_project_artifact(dataframe)
+
+    assert artifact_key == "gretel_abc_data.csv"
+    assert projects_api.create_artifact.call_args.kwargs["artifact"].filename == (
+        "dataframe-df-uuid.csv.gz"
+    )
+    assert [gzip.decompress(body) for body in uploaded] == [b"foo,bar\n1,4\n2,5\n3,6\n"]
+
+
+@patch("gretel_client.projects.artifact_handlers._get_http_session")
+def test_cloud_upload_skips_unchanged_artifacts(
+    get_http_session: MagicMock, tmp_path: Path
+):
+    projects_api = MagicMock()
+    projects_api.create_artifact.side_effect = [
+        {"data": {"key": f"gretel_{i}_data.csv", "url": "https://signed.url"}}
+        for i in range(4)
+    ]
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+    source = tmp_path / "data.csv"
+    source.write_text("h1,h2\n1,2\n")
+    dataframe = pd.DataFrame(data={"foo": [1, 2, 3], "bar": [4, 5, 6]})
+
+    assert handler.upload_project_artifact(str(source)) == "gretel_0_data.csv"
+    assert handler.upload_project_artifact(source) == "gretel_0_data.csv"
+    assert handler.upload_project_artifact(dataframe) == "gretel_1_data.csv"
+    assert handler.upload_project_artifact(dataframe.copy()) == "gretel_1_data.csv"
+    assert projects_api.create_artifact.call_count == 2
+
+    # Changed contents are uploaded again.
+    dataframe.loc[0, "foo"] = 10
+    assert handler.upload_project_artifact(dataframe) == "gretel_2_data.csv"
+
+    # So are deleted artifacts.
+    handler.delete_project_artifact("gretel_0_data.csv")
+    assert handler.upload_project_artifact(str(source)) == "gretel_3_data.csv"
+    assert get_http_session.return_value.put.call_count == 4
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        ([True, False], [1, 0]),
+        ([0], pd.to_datetime([0])),
+    ],
+)
+@patch("gretel_client.projects.artifact_handlers._get_http_session")
+def test_cloud_upload_tells_apart_frames_with_different_dtypes(
+    get_http_session: MagicMock, first, second
+):
+    projects_api = MagicMock()
+    projects_api.create_artifact.side_effect = [
+        {"data": {"key": f"gretel_{i}_data.csv", "url": "https://signed.url"}}
+        for i in range(2)
+    ]
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+
+    first_key = handler.upload_project_artifact(pd.DataFrame({"a": first}))
+    second_key = handler.upload_project_artifact(pd.DataFrame({"a": second}))
+
+    assert (first_key, second_key) == ("gretel_0_data.csv", "gretel_1_data.csv")
+
+
+def test_artifact_http_session_is_shared():
+    try:
+        session = _get_http_session()
+        assert _get_http_session() is session
+
+        close_artifact_session()
+        assert _get_http_session() is not session
+    finally:
+        close_artifact_session()
+
+
+@pytest.fixture
+def fake_clock():
+    """Patches ``time.sleep`` to advance a fake clock instead of sleeping."""
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    with patch("time.sleep", side_effect=sleep), patch(
+        "time.monotonic", side_effect=lambda: now[0]
+    ):
+        yield sleeps
+
+
+def test_cloud_manifest_retries_while_pending(fake_clock):
+    projects_api = MagicMock()
+    projects_api.get_artifact_manifest.side_effect = [
+        {"status": "pending"},
+        {"status": "pending"},
+        {"status": "done"},
+    ]
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+
+    assert handler.get_project_artifact_manifest("key") == {"status": "done"}
+    assert len(fake_clock) == 2
+    # Backoff starts small and grows.
+    assert 0.5 <= fake_clock[0] <= 1.0
+    assert 1.0 <= fake_clock[1] <= 1.5
+
+
+def test_cloud_manifest_returns_pending_manifest_when_giving_up(fake_clock):
+    projects_api = MagicMock()
+    projects_api.get_artifact_manifest.return_value = {"status": "pending"}
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+
+    assert handler.get_project_artifact_manifest("key") == {"status": "pending"}
+    assert 30 <= sum(fake_clock) <= 30 + 8.5
+
+
+def test_cloud_manifest_gives_up_when_not_found(fake_clock):
+    projects_api = MagicMock()
+    projects_api.get_artifact_manifest.side_effect = NotFoundException()
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+
+    assert handler.get_project_artifact_manifest("key") is None
+    assert 12 <= sum(fake_clock) <= 12 + 8.5
+
+
+def test_cloud_manifest_without_retries(fake_clock):
+    projects_api = MagicMock()
+    handler = CloudArtifactsHandler(projects_api, "project_id", "proj")
+
+    projects_api.get_artifact_manifest.return_value = {"status": "pending"}
+    assert handler.get_project_artifact_manifest(
+        "key", retry_on_not_found=False, retry_on_pending=False
+    ) == {"status": "pending"}
+
+    projects_api.get_artifact_manifest.side_effect = NotFoundException()
+    assert (
+        handler.get_project_artifact_manifest(
+            "key", retry_on_not_found=False, retry_on_pending=False
+        )
+        is None
+    )
+    assert projects_api.get_artifact_manifest.call_count == 2
+    assert fake_clock == []
+
+
+def test_api_gate_opens_circuit_after_repeated_server_errors(fake_clock):
+    gate = _ApiGate(failure_threshold=3, open_seconds=10)
+    method = MagicMock(side_effect=ApiException(status=503))
+
+    for _ in range(3):
+        with pytest.raises(ApiException):
+            gate.call("get_artifacts", method)
+
+    # Fails fast without calling the API, other API methods are unaffected.
+    with pytest.raises(ArtifactsApiUnavailableException):
+        gate.call("get_artifacts", method)
+    assert method.call_count == 3
+    assert gate.call("download_artifact", MagicMock(return_value="ok")) == "ok"
+
+    # After the circuit was open for long enough, a trial call closes it.
+    time.sleep(10)
+    method.side_effect = None
+    method.return_value = "ok"
+    assert gate.call("get_artifacts", method) == "ok"
+    assert gate.call("get_artifacts", method) == "ok"
+
+
+def test_api_gate_half_open_circuit_reopens_on_failure(fake_clock):
+    gate = _ApiGate(failure_threshold=1, open_seconds=10)
+    method = MagicMock(side_effect=ApiException(status=500))
+
+    with pytest.raises(ApiException):
+        gate.call("get_artifacts", method)
+    time.sleep(10)
+    with pytest.raises(ApiException):
+        gate.call("get_artifacts", method)
+    with pytest.raises(ArtifactsApiUnavailableException):
+        gate.call("get_artifacts", method)
+
+
+def test_api_gate_honors_retry_after(fake_clock):
+    gate = _ApiGate(failure_threshold=5, open_seconds=10)
+    http_resp = Mock(status=429, reason="Too Many Requests", data=b"")
+    http_resp.getheaders.return_value = {"Retry-After": "30"}
+    method = MagicMock(side_effect=ApiException(http_resp=http_resp))
+
+    with pytest.raises(ApiException):
+        gate.call("create_artifact", method)
+
+    time.sleep(20)
+    with pytest.raises(ArtifactsApiUnavailableException):
+        gate.call("create_artifact", method)
+    time.sleep(10)
+    with pytest.raises(ApiException):
+        gate.call("create_artifact", method)
+
+
+def test_api_gate_does_not_count_client_errors(fake_clock):
+    gate = _ApiGate(failure_threshold=1)
+    method = MagicMock(side_effect=NotFoundException(status=404))
+
+    for _ in range(3):
+        with pytest.raises(NotFoundException):
+            gate.call("get_artifact_manifest", method)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        # GretelApiRetry's error for a 403 that is not throttling.
+        MaxRetryError(None, "https://api.gretel.cloud", None),
+        ApiValueError("Invalid value for `project_id`"),
+        ApiException(status=0, reason="SSLError"),
+    ],
+)
+def test_api_gate_does_not_count_errors_unrelated_to_availability(fake_clock, error):
+    gate = _ApiGate(failure_threshold=1)
+    method = MagicMock(side_effect=error)
+
+    for _ in range(3):
+        with pytest.raises(type(error)):
+            gate.call("create_artifact", method)
+
+
+def test_api_gate_counts_connection_errors(fake_clock):
+    gate = _ApiGate(failure_threshold=2, open_seconds=10)
+    error = MaxRetryError(
+        None, "https://api.gretel.cloud", NewConnectionError(None, "refused")
+    )
+    method = MagicMock(side_effect=error)
+
+    for _ in range(2):
+        with pytest.raises(MaxRetryError):
+            gate.call("create_artifact", method)
+    with pytest.raises(ArtifactsApiUnavailableException):
+        gate.call("create_artifact", method)
+
+    # A trial call that fails for another reason doesn't decide the circuit,
+    # the next call is let through as the trial instead.
+    time.sleep(10)
+    method.side_effect = ApiValueError("Invalid value for `project_id`")
+    with pytest.raises(ApiValueError):
+        gate.call("create_artifact", method)
+    method.side_effect = None
+    method.return_value = "ok"
+    assert gate.call("create_artifact", method) == "ok"
+
+
+def test_api_gate_rate_limits_calls(fake_clock):
+    gate = _ApiGate(rate=10, burst=2)
+    method = MagicMock()
+
+    for _ in range(4):
+        gate.call("get_artifacts", method)
+
+    assert fake_clock == [pytest.approx(0.1), pytest.approx(0.1)]
+
+
 def test_hybrid_handler_limited_functionality():
     handler = HybridArtifactsHandler("endpoint", "project_id")
 
@@ -196,6 +579,69 @@ def test_hybrid_upload_local_file_as_project_artifact(uuid4, endpoint):
         os.unlink(source.name)
 
 
+def test_hybrid_upload_copies_compressed_file_as_is(endpoint, tmp_path):
+    source = tmp_path / "data.csv.gz"
+    source.write_bytes(gzip.compress(b"h1,h2\n1,2\n"))
+
+    handler = HybridArtifactsHandler(endpoint, "project_id")
+    artifact_path = handler.upload_project_artifact(str(source))
+
+    assert Path(artifact_path).read_bytes() == source.read_bytes()
+
+
+@patch("uuid.uuid4")
+@patch("gretel_client.projects.artifact_handlers._get_s3_client")
+def test_hybrid_upload_to_s3_uses_native_transfer(get_s3_client, uuid4, tmp_path):
+    uuid4.return_value = Mock(hex="uuid")
+    source = tmp_path / "data.csv"
+    source.write_text("h1,h2\n1,2\n")
+
+    handler = HybridArtifactsHandler("s3://my-bucket", "project_id")
+    with patch("smart_open.open") as smart_open_mock:
+        artifact_path = handler.upload_project_artifact(str(source))
+
+    assert artifact_path == "s3://my-bucket/sources/project_id/gretel_uuid_data.csv"
+    get_s3_client.return_value.upload_file.assert_called_once_with(
+        str(source),
+        "my-bucket",
+        "sources/project_id/gretel_uuid_data.csv",
+        Config=ANY,
+    )
+    smart_open_mock.assert_not_called()
+
+
+@patch("gretel_client.projects.artifact_handlers._get_s3_client")
+def test_hybrid_download_from_s3_uses_native_transfer(get_s3_client, tmp_path):
+    handler = HybridArtifactsHandler("s3://my-bucket", "project_id")
+    model_artifact = handler.get_model_artifact_link("model_id", "report")
+
+    handler.download(model_artifact, tmp_path, "report", Mock())
+
+    get_s3_client.return_value.download_file.assert_called_once_with(
+        "my-bucket",
+        "project_id/model/model_id/report.html.gz",
+        str(tmp_path / "report.html.gz"),
+        Config=ANY,
+    )
+
+
+def test_s3_client_is_built_once_across_threads():
+    def slow_client(*args, **kwargs):
+        time.sleep(0.05)
+        return Mock()
+
+    _create_s3_client.cache_clear()
+    try:
+        with patch("boto3.client", side_effect=slow_client) as boto3_client:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                clients = list(pool.map(lambda _: _get_s3_client(), range(4)))
+
+        boto3_client.assert_called_once_with("s3")
+        assert all(client is clients[0] for client in clients)
+    finally:
+        _create_s3_client.cache_clear()
+
+
 @patch("uuid.uuid4")
 def test_hybrid_upload_dataframe_as_project_artifact(uuid4, endpoint):
     uuid4.side_effect = ["df-uuid", Mock(hex="gruuid")]
@@ -208,19 +654,24 @@ def test_hybrid_upload_dataframe_as_project_artifact(uuid4, endpoint):
     uploaded_artifact = Path(artifact_key)
     sources_dir = Path(endpoint) / "sources" / "project_id"
     expected_uploaded_artifact_path = (
-        sources_dir / "gretel_gruuid_dataframe-df-uuid.csv"
+        sources_dir / "gretel_gruuid_dataframe-df-uuid.csv.gz"
     )
 
     assert uploaded_artifact.exists()
     assert uploaded_artifact == expected_uploaded_artifact_path
     assert len(os.listdir(sources_dir)) == 1
+    assert pd.read_csv(uploaded_artifact).equals(dataframe)
 
 
 def test_hybrid_does_not_upload_remote_artifacts(endpoint):
     remote_data_source = "https://raw.githubusercontent.com/gretelai/gretel-blueprints/main/sample_data/sample-synthetic-healthcare.csv"
 
     handler = HybridArtifactsHandler(endpoint, "project_id")
-    artifact_key = handler.upload_project_artifact(remote_data_source)
+    with patch(
+        "gretel_client.projects.artifact_handlers.Path.exists"
+    ) as path_exists_mock:
+        artifact_key = handler.upload_project_artifact(remote_data_source)
+    path_exists_mock.assert_not_called()
     assert artifact_key == remote_data_source
 
     sources_dir = Path(endpoint) / "sources" / "project_id"
@@ -313,3 +764,36 @@ def test_hybrid_download(endpoint):
 
         downloaded_file = output / "report.html.gz"
         assert downloaded_file.exists()
+
+
+def test_hybrid_download_missing_artifact_raises(endpoint, tmp_path):
+    handler = HybridArtifactsHandler(endpoint, "project_id")
+    model_artifact = handler.get_model_artifact_link("model_id", "report")
+    log = Mock()
+
+    with pytest.raises(ArtifactsException) as exc_info:
+        handler.download(model_artifact, tmp_path, "report", log)
+
+    assert isinstance(exc_info.value.__cause__, FileNotFoundError)
+    log.error.assert_called_once()
+
+
+def test_download_many(endpoint, tmp_path):
+    handler = HybridArtifactsHandler(endpoint, "project_id")
+    model_dir = Path(endpoint) / "project_id" / "model" / "model_id"
+    model_dir.mkdir(parents=True, exist_ok=True)
+    (model_dir / "report.html.gz").write_bytes(b"report")
+    (model_dir / "logs.json.gz").write_bytes(b"logs")
+
+    failed = download_many(
+        handler,
+        [
+            (handler.get_model_artifact_link("model_id", t), tmp_path, t)
+            for t in ("report", "model_logs", "report_json")
+        ],
+        Mock(),
+    )
+
+    assert failed == ["report_json"]
+    assert (tmp_path / "report.html.gz").read_bytes() == b"report"
+    assert (tmp_path / "logs.json.gz").read_bytes() == b"logs"
@@ -1,6 +1,7 @@
 import os
 
-from typing import Callable
+from pathlib import Path
+from typing import Callable, List
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
@@ -289,7 +290,7 @@ def test_search_models_with_model_name(
 
 
 @patch.dict(os.environ, {"RUNNER_MODES": "hybrid manual"})
-@patch("gretel_client.cli.agent.get_agent")
+@patch("gretel_client.agents.agent.get_agent")
 @patch("gretel_client.agents.agent.AgentConfig._update_max_workers")
 def test_get_agent_env_var_passing(
     max_worker_mock: MagicMock,
@@ -314,8 +315,98 @@ def test_get_agent_env_var_passing(
     assert cmd.exit_code == 0
 
 
+@patch("gretel_client.agents.agent.get_agent")
+@patch("gretel_client.agents.agent.AgentConfig._update_max_workers")
+def test_get_agent_volumes_and_envs(
+    max_worker_mock: MagicMock,
+    get_agent_mock: MagicMock,
+    runner: CliRunner,
+):
+    cmd = runner.invoke(
+        cli,
+        [
+            "agent",
+            "start",
+            "--driver",
+            "k8s",
+            "--env",
+            "FOO=bar=baz",
+            "--volume",
+            "/host/a.txt:/data/a.txt",
+            "--volume",
+            "/host/b.txt:/data/b.txt",
+            "--volume",
+            "/host/c.txt:/other/c.txt",
+        ],
+    )
+    assert cmd.exit_code == 0
+    args, _ = get_agent_mock.call_args
+    config = args[0]
+    assert config.env_vars == {"FOO": "bar=baz"}
+    assert [(v.target_dir, v.host_files) for v in config.volumes] == [
+        ("/data", [("/host/a.txt", "a.txt"), ("/host/b.txt", "b.txt")]),
+        ("/other", [("/host/c.txt", "c.txt")]),
+    ]
+
+
+@patch("gretel_client.agents.agent.get_agent")
+@patch("gretel_client.agents.agent.AgentConfig._update_max_workers")
+def test_get_agent_env_file(
+    max_worker_mock: MagicMock,
+    get_agent_mock: MagicMock,
+    runner: CliRunner,
+    tmp_path: Path,
+):
+    env_file = tmp_path / "worker.env"
+    env_file.write_text("# worker settings\nFOO=from-file\n\nBAR=baz\n")
+    cmd = runner.invoke(
+        cli,
+        [
+            "agent",
+            "start",
+            "--driver",
+            "k8s",
+            "--env-file",
+            str(env_file),
+            "--env",
+            "FOO=from-flag",
+        ],
+    )
+    assert cmd.exit_code == 0
+    args, _ = get_agent_mock.call_args
+    assert args[0].env_vars == {"FOO": "from-flag", "BAR": "baz"}
+
+
+@pytest.mark.parametrize(
+    "args,error",
+    [
+        (["--env", "FOO"], "'FOO' is not a valid KEY=VALUE entry"),
+        (["--env", "=bar"], "'=bar' is not a valid KEY=VALUE entry"),
+        (["--env-file", "{env_file}"], "line 2"),
+    ],
+)
+@patch("gretel_client.agents.agent.get_agent")
+def test_get_agent_invalid_env(
+    get_agent_mock: MagicMock,
+    runner: CliRunner,
+    tmp_path: Path,
+    args: List[str],
+    error: str,
+):
+    env_file = tmp_path / "worker.env"
+    env_file.write_text("FOO=bar\nexport BAZ=qux\n")
+    cmd = runner.invoke(
+        cli,
+        ["agent", "start", "--driver", "k8s"]
+        + [arg.format(env_file=env_file) for arg in args],
+    )
+    assert cmd.exit_code == 2
+    assert error in cmd.output
+    get_agent_mock.assert_not_called()
+
+
 @patch.dict(os.environ, {"RUNNER_MODES": "hybrid manualy"})
-@patch("gretel_client.cli.agent.get_agent")
+@patch("gretel_client.agents.agent.get_agent")
 @patch("gretel_client.agents.agent.AgentConfig._update_max_workers")
 def test_get_agent_env_var_passing_fails(
     max_worker_mock: MagicMock,
@@ -362,3 +453,48 @@ def test_workflows_read_from_env_manual(
         == "ERROR: Workflows only supported for 'cloud' or 'hybrid', not 'manual'\n"
     )
     assert cmd.exit_code == 1
+
+
+@pytest.mark.parametrize("preview_features", ["enabled", "disabled"])
+@patch("gretel_client.cli.agent.get_session_config")
+def test_agent_hidden_unless_preview_enabled(
+    get_session_config: MagicMock, preview_features: str, runner: CliRunner
+):
+    get_session_config.return_value = ClientConfig(preview_features=preview_features)
+    cmd = runner.invoke(cli, ["--help"])
+    assert cmd.exit_code == 0
+    assert ("agent" in cmd.output) == (preview_features == "enabled")
+
+
+@patch.dict(os.environ, {"GRETEL_DISABLE_GPU": "1"})
+@patch("gretel_client.docker.check_gpu")
+@patch("gretel_client.agents.agent.get_agent")
+@patch("gretel_client.agents.agent.AgentConfig._update_max_workers")
+def test_get_agent_gpu_check_disabled(
+    max_worker_mock: MagicMock,
+    get_agent_mock: MagicMock,
+    check_gpu_mock: MagicMock,
+    runner: CliRunner,
+):
+    cmd = runner.invoke(cli, ["agent", "start", "--driver", "docker"])
+    assert cmd.exit_code == 0
+    check_gpu_mock.assert_not_called()
+    args, _ = get_agent_mock.call_args
+    assert args[0].capabilities == []
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--volume", "/host/a.txt"],
+        ["--aws-cred-path", "/path/that/does/not/exist"],
+        ["--ca-bundle", "/path/that/does/not/exist"],
+    ],
+)
+@patch("gretel_client.agents.agent.get_agent")
+def test_get_agent_invalid_paths(
+    get_agent_mock: MagicMock, args: list, runner: CliRunner
+):
+    cmd = runner.invoke(cli, ["agent", "start", "--driver", "k8s", *args])
+    assert cmd.exit_code == 2
+    get_agent_mock.assert_not_called()
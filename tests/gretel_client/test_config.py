@@ -12,6 +12,7 @@ import pytest
 from urllib3 import HTTPResponse
 from urllib3.exceptions import MaxRetryError
 
+from gretel_client._hybrid.config import hybrid_session_config
 from gretel_client.config import (
     _load_config,
     ClientConfig,
@@ -60,6 +61,24 @@ def test_env_runner_mode(monkeypatch):
     assert config.default_runner == RunnerMode.LOCAL
 
 
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("hybrid", RunnerMode.HYBRID),
+        (RunnerMode.LOCAL, RunnerMode.LOCAL),
+        ("manual", RunnerMode.MANUAL),
+    ],
+)
+def test_runner_mode_parse(value, expected):
+    assert RunnerMode.parse(value) is expected
+
+
+@pytest.mark.parametrize("value", ["HYBRID", "manualy", None, ["cloud"]])
+def test_runner_mode_parse_invalid(value):
+    with pytest.raises(ValueError):
+        RunnerMode.parse(value)
+
+
 def test_does_set_session_factory(dev_ep):
     with patch.dict(os.environ, {}, clear=True):
         config = ClientConfig(
@@ -353,3 +372,77 @@ def test_retry_throttling_403s():
         )
 
     assert e.value.reason == error
+
+
+def test_hybrid_session_config_copies_session(dev_ep):
+    with patch.dict(os.environ, {}, clear=True):
+        session = ClientConfig(
+            endpoint=dev_ep,
+            artifact_endpoint="s3://my-bucket",
+            api_key="grtu...",
+            default_project_name="proj",
+            default_runner="hybrid",
+        )
+    creds_encryption = MagicMock()
+
+    with patch.dict(os.environ, {GRETEL_RUNNER_MODE: "cloud"}):
+        hybrid_config = hybrid_session_config(
+            creds_encryption, deployment_user="user@example.com", session=session
+        )
+
+    assert hybrid_config == session
+    assert hybrid_config.default_runner == RunnerMode.HYBRID
+    assert hybrid_config._creds_encryption is creds_encryption
+    assert hybrid_config._deployment_user == "user@example.com"
+
+
+def test_hybrid_session_config_reuses_api_clients(dev_ep):
+    with patch.dict(os.environ, {}, clear=True):
+        session = ClientConfig(
+            endpoint=dev_ep,
+            artifact_endpoint="s3://my-bucket",
+            api_key="grtu...",
+            default_runner="hybrid",
+        )
+    hybrid_config = hybrid_session_config(MagicMock(), session=session)
+
+    projects_api = hybrid_config.get_api(ProjectsApi)
+    assert hybrid_config.get_api(ProjectsApi) is projects_api
+    assert hybrid_config.get_api(ProjectsApi, max_retry_attempts=1) is not projects_api
+
+    hybrid_config.api_key = "grtu...NEW"
+    assert hybrid_config.get_api(ProjectsApi) is not projects_api
+
+
+def test_hybrid_session_config_reuses_hybrid_session(dev_ep):
+    with patch.dict(os.environ, {}, clear=True):
+        session = ClientConfig(
+            endpoint=dev_ep,
+            artifact_endpoint="s3://my-bucket",
+            api_key="grtu...",
+            default_runner="hybrid",
+        )
+    creds_encryption = MagicMock()
+    hybrid_config = hybrid_session_config(creds_encryption, session=session)
+
+    assert hybrid_session_config(creds_encryption, session=hybrid_config) is (
+        hybrid_config
+    )
+
+    rewrapped = hybrid_session_config(
+        creds_encryption, deployment_user="user@example.com", session=hybrid_config
+    )
+    assert rewrapped is not hybrid_config
+    assert rewrapped == hybrid_config
+    assert rewrapped._deployment_user == "user@example.com"
+
+
+@patch("gretel_client.config._load_config")
+def test_session_config_loaded_once_on_first_access(
+    _load_config_mock: MagicMock, monkeypatch
+):
+    monkeypatch.setattr("gretel_client.config._session_client_config", None)
+
+    config = get_session_config()
+    assert get_session_config() is config
+    _load_config_mock.assert_called_once()
@@ -0,0 +1,12 @@
+from pathlib import Path
+
+from setuptools import find_namespace_packages
+from setuptools.config.pyprojecttoml import read_configuration
+
+REPO_ROOT = Path(__file__).parents[2]
+
+
+def test_static_package_list_matches_source_tree():
+    pyproject = read_configuration(REPO_ROOT / "pyproject.toml", expand=False)
+    packages = pyproject["tool"]["setuptools"]["packages"]
+    assert sorted(packages) == sorted(find_namespace_packages(REPO_ROOT / "src"))